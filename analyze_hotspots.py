@@ -21,24 +21,59 @@ The script will generate an interactive D3.js visualization and open it in your
 import subprocess
 import os
 import sys
+import gzip
 import json
 import argparse
+import email.utils
 import http.server
-import socketserver
 import webbrowser
 import threading
 import re
+import shutil
 import fnmatch
+import functools
 import hashlib
+import operator
+import pickle
+import stat
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
 
 
 # Cache directory for storing analysis results (inside the script's directory)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
 
+# Static files of the visualization, copied into the output directory
+TEMPLATE_DIR = os.path.join(SCRIPT_DIR, 'templates')
+
+# Small metadata sidecar written next to each cached analysis, read by --list-cache
+META_SUFFIX = '.meta.json'
+
+# Per-commit results, keyed by full commit SHA (commits are immutable, so never stale)
+COMMIT_CACHE_DIR = os.path.join(CACHE_DIR, 'commits')
+
+# Files larger than this are assumed to be generated and skipped when counting lines
+MAX_LOC_FILE_SIZE = 5 * 1024 * 1024
+
+# Histories with at least this many commits are parsed by several git processes in parallel
+PARALLEL_LOG_MIN_COMMITS = 10_000
+
+# Commit details for the visualization go to <COMMIT_SHARD_DIR>/<n>.json in the
+# output directory, COMMIT_SHARD_SIZE files per shard
+COMMIT_SHARD_DIR = 'hotspot_commits'
+COMMIT_SHARD_SIZE = 256
+SHARD_FILE_RE = re.compile(r'(\d+)\.json(?:\.gz)?$')
+
 
 # Default patterns to exclude from analysis
 # These are files that are typically generated, dependencies, or not actual source code
@@ -155,28 +190,30 @@ DEFAULT_EXCLUSIONS = [
 ]
 
 
-def get_git_head_hash(repo_path):
-    """Get the current HEAD commit hash for cache validation."""
-    try:
-        result = subprocess.run(
-            ['git', '-C', repo_path, 'rev-parse', 'HEAD'],
-            capture_output=True, text=True, check=True
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
-
-
-def get_git_commit_count(repo_path, since_date=None):
-    """Get the number of commits (used for cache validation)."""
-    try:
-        args = ['git', '-C', repo_path, 'rev-list', '--count', 'HEAD']
-        if since_date:
-            args.extend(['--after', since_date])
-        result = subprocess.run(args, capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+@functools.lru_cache(maxsize=None)
+def get_git_state(repo_path, since_date=None):
+    """
+    Get (tree_hash, commit_count) for cache validation.
+    The tree hash of HEAD survives amends and rebases that keep the content;
+    the commit count covers the analyzed time period. Both git commands run
+    concurrently, and the result is memoized so load and save share it.
+    """
+    count_args = ['git', '-C', repo_path, 'rev-list', '--count', 'HEAD']
+    if since_date:
+        count_args.extend(['--after', since_date])
+    
+    procs = [
+        subprocess.Popen(['git', '-C', repo_path, 'rev-parse', 'HEAD^{tree}'],
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True),
+        subprocess.Popen(count_args,
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True),
+    ]
+    results = []
+    for proc in procs:
+        stdout, _ = proc.communicate()
+        results.append(stdout.strip() if proc.returncode == 0 else None)
+    
+    return tuple(results)
 
 
 def generate_cache_key(repo_path, since_date, exclusions):
@@ -196,42 +233,79 @@ def generate_cache_key(repo_path, since_date, exclusions):
     return hashlib.md5(params_str.encode()).hexdigest()
 
 
-def get_cache_path(cache_key):
-    """Get the path to the cache file for a given key."""
+def get_cache_path(cache_key, suffix='.pickle'):
+    """
+    Get the path to a cache file for a given key.
+    Each analysis has a pickled data file and a small metadata sidecar
+    (META_SUFFIX) that can be listed and validated without unpickling.
+    """
     os.makedirs(CACHE_DIR, exist_ok=True)
-    return os.path.join(CACHE_DIR, f'{cache_key}.json')
+    return os.path.join(CACHE_DIR, f'{cache_key}{suffix}')
+
+
+def get_commit_cache_path(sha):
+    """Get the path to the per-commit cache file for a full commit SHA."""
+    return os.path.join(COMMIT_CACHE_DIR, f'{sha}.json')
+
+
+def load_commit_cache(sha):
+    """Load a cached (commit, files) pair, or None if it is missing or unreadable."""
+    try:
+        with open(get_commit_cache_path(sha), 'r') as f:
+            cached = json.load(f)
+        return cached['commit'], cached['files']
+    except (json.JSONDecodeError, KeyError, IOError):
+        return None
+
+
+def save_commit_cache(sha, commit, files):
+    """Save one commit's parsed data to the per-commit cache."""
+    os.makedirs(COMMIT_CACHE_DIR, exist_ok=True)
+    cache_path = get_commit_cache_path(sha)
+    tmp_path = cache_path + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps({'commit': commit, 'files': files}))
+        # Atomic rename so an interrupted run never leaves a truncated entry
+        os.replace(tmp_path, cache_path)
+    except IOError as e:
+        print(f"Warning: Could not save commit cache: {e}")
 
 
 def load_cache(repo_path, since_date, exclusions):
     """
     Load cached analysis results if valid.
-    Returns (data, is_valid) tuple.
+    Returns (data, is_valid) tuple. Only the metadata sidecar is read
+    unless the cache is valid; a stale cache returns its metadata.
     """
     cache_key = generate_cache_key(repo_path, since_date, exclusions)
-    cache_path = get_cache_path(cache_key)
+    meta_path = get_cache_path(cache_key, META_SUFFIX)
     
-    if not os.path.exists(cache_path):
+    if not os.path.exists(meta_path):
         return None, False
     
     try:
-        with open(cache_path, 'r') as f:
-            cached = json.load(f)
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
         
-        # Validate cache - check if repo HEAD has changed
-        current_head = get_git_head_hash(repo_path)
-        cached_head = cached.get('git_head')
+        # Validate cache - check if the content at HEAD or the
+        # commit count for the time period has changed
+        current_tree, current_count = get_git_state(repo_path, since_date)
+        cached_tree = meta.get('git_tree')
+        cached_count = meta.get('commit_count')
         
-        # Also check commit count for the time period
-        current_count = get_git_commit_count(repo_path, since_date)
-        cached_count = cached.get('commit_count')
-        
-        if current_head == cached_head and current_count == cached_count:
-            return cached, True
-        else:
-            return cached, False  # Cache exists but is stale
-            
+        if current_tree != cached_tree or current_count != cached_count:
+            return meta, False  # Cache exists but is stale
     except (json.JSONDecodeError, KeyError, IOError):
         return None, False
+    
+    try:
+        with open(get_cache_path(cache_key), 'rb') as f:
+            return pickle.load(f), True
+    except Exception:
+        # A truncated or incompatible pickle can fail in many ways
+        # (AttributeError, ValueError, ImportError, ...) - treat it as a miss
+        return None, False
 
 
 def save_cache(repo_path, since_date, exclusions, data):
@@ -240,14 +314,26 @@ def save_cache(repo_path, since_date, exclusions, data):
     cache_path = get_cache_path(cache_key)
     
     # Add cache metadata
-    data['git_head'] = get_git_head_hash(repo_path)
-    data['commit_count'] = get_git_commit_count(repo_path, since_date)
+    data['git_tree'], data['commit_count'] = get_git_state(repo_path, since_date)
     data['cached_at'] = datetime.now().isoformat()
     data['cache_key'] = cache_key
     
+    meta = {
+        'repository': data.get('repository'),
+        'since_date': data.get('since_date'),
+        'files': len(data.get('hotspots', [])),
+        'git_tree': data['git_tree'],
+        'commit_count': data['commit_count'],
+        'cached_at': data['cached_at'],
+        'cache_key': cache_key
+    }
+    
     try:
-        with open(cache_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Written last, so a sidecar always points at a complete data file
+        with open(get_cache_path(cache_key, META_SUFFIX), 'w') as f:
+            json.dump(meta, f, indent=2)
         return cache_path
     except IOError as e:
         print(f"Warning: Could not save cache: {e}")
@@ -259,38 +345,42 @@ def clear_cache(repo_path=None, since_date=None, exclusions=None, clear_all=Fals
     if clear_all:
         # Clear all cache files
         if os.path.exists(CACHE_DIR):
-            import shutil
             shutil.rmtree(CACHE_DIR)
             os.makedirs(CACHE_DIR)
         return True
     elif repo_path:
         # Clear cache for specific parameters
         cache_key = generate_cache_key(repo_path, since_date, exclusions)
-        cache_path = get_cache_path(cache_key)
-        if os.path.exists(cache_path):
-            os.remove(cache_path)
-            return True
+        removed = False
+        # '.json' covers data files written by older versions
+        for suffix in (META_SUFFIX, '.pickle', '.json'):
+            cache_path = get_cache_path(cache_key, suffix)
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+                removed = True
+        return removed
     return False
 
 
 def list_cached_analyses():
-    """List all cached analyses."""
+    """List all cached analyses by reading only their metadata sidecars."""
     if not os.path.exists(CACHE_DIR):
         return []
     
     cached = []
-    for filename in os.listdir(CACHE_DIR):
-        if filename.endswith('.json'):
-            filepath = os.path.join(CACHE_DIR, filename)
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(META_SUFFIX):
+                continue
             try:
-                with open(filepath, 'r') as f:
+                with open(entry.path, 'r') as f:
                     data = json.load(f)
                 cached.append({
-                    'file': filename,
+                    'file': entry.name,
                     'repo': data.get('repository', 'Unknown'),
                     'cached_at': data.get('cached_at', 'Unknown'),
                     'since': data.get('since_date', 'All time'),
-                    'files': len(data.get('hotspots', []))
+                    'files': data.get('files', 0)
                 })
             except (json.JSONDecodeError, IOError):
                 continue
@@ -298,34 +388,83 @@ def list_cached_analyses():
     return cached
 
 
-def should_exclude(filepath, exclusion_patterns):
+def is_literal_name(text):
+    """Check if text is a single path component without glob wildcards."""
+    return bool(text) and not any(c in text for c in '/*?[')
+
+
+def compile_globs(globs):
+    """Combine fnmatch globs into one case-insensitive regex, or None if there are none."""
+    if not globs:
+        return None
+    # dict.fromkeys drops duplicates while keeping the order stable
+    regex = '|'.join(fnmatch.translate(glob) for glob in dict.fromkeys(globs))
+    return re.compile(regex, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def compile_exclusions(patterns):
     """
-    Check if a file should be excluded based on exclusion patterns.
-    Supports glob-style patterns.
+    Compile a tuple of glob patterns into an `is_excluded(filepath)` predicate.
+    A pattern matches the full path, any trailing part of the path, or
+    any single path component (e.g. 'node_modules/*' matches 'a/node_modules/b').
+    
+    Patterns are partitioned up front: plain names ('yarn.lock'), directory
+    names ('node_modules/*') and extensions ('*.png') become set lookups, and
+    only the remaining true globs are combined into one case-insensitive regex.
+    A glob's component form is matched against each component on its own, so
+    its wildcards never cross a '/'.
     """
-    filepath_lower = filepath.lower()
-    
-    for pattern in exclusion_patterns:
-        pattern_lower = pattern.lower()
-        
-        # Check if pattern matches the full path or just the filename
-        if fnmatch.fnmatch(filepath_lower, pattern_lower):
+    names = set()
+    dirs = set()
+    suffixes = set()
+    globs = []
+    component_globs = []
+    
+    for pattern in patterns:
+        pattern = pattern.lower()
+        if pattern.endswith('/*') and is_literal_name(pattern[:-2]):
+            dirs.add(pattern[:-2])
+        elif is_literal_name(pattern):
+            names.add(pattern)
+        elif pattern.startswith('*') and is_literal_name(pattern[1:]):
+            suffixes.add(pattern[1:])
+        else:
+            globs.extend((pattern, '*/' + pattern))
+            component = pattern.rstrip('/*')
+            if is_literal_name(component):
+                dirs.add(component)
+            elif component and '/' not in component:
+                component_globs.append(component)
+    
+    suffixes = tuple(suffixes)
+    glob_re = compile_globs(globs)
+    component_re = compile_globs(component_globs)
+    
+    def is_excluded(filepath):
+        filepath = filepath.lower()
+        parts = filepath.split('/')
+        if names and not names.isdisjoint(parts):
+            return True
+        # 'dir/*' only matches a lone component once the path has a '/'
+        if dirs and len(parts) > 1 and not dirs.isdisjoint(parts):
+            return True
+        if suffixes and any(part.endswith(suffixes) for part in parts):
             return True
-        if fnmatch.fnmatch(filepath_lower, '*/' + pattern_lower):
+        if component_re is not None and len(parts) > 1 and any(
+                component_re.match(part) for part in parts):
             return True
-        # Also check if any path component matches
-        if '/' in filepath:
-            parts = filepath_lower.split('/')
-            for i, part in enumerate(parts):
-                # Check filename match
-                if fnmatch.fnmatch(part, pattern_lower.rstrip('/*')):
-                    return True
-                # Check partial path match
-                partial_path = '/'.join(parts[i:])
-                if fnmatch.fnmatch(partial_path, pattern_lower):
-                    return True
+        return glob_re is not None and glob_re.match(filepath) is not None
     
-    return False
+    return is_excluded
+
+
+def should_exclude(filepath, exclusion_patterns):
+    """
+    Check if a file should be excluded based on exclusion patterns.
+    Supports glob-style patterns.
+    """
+    return compile_exclusions(tuple(exclusion_patterns))(filepath)
 
 
 def run_git_command(repo_path, args):
@@ -340,184 +479,373 @@ def run_git_command(repo_path, args):
         return None
 
 
-def get_revision_frequency(repo_path, since_date=None, exclusions=None):
+def iter_nul_records(stream, chunk_size=1 << 20):
+    """Yield the NUL-terminated records of a binary stream (e.g. `git ... -z` output)."""
+    pending = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (pending + chunk).split(b'\0')
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+
+def stream_git(repo_path, args, stdin_data=None):
     """
-    Get the number of times each file has been modified.
-    This is the core metric for identifying hotspots.
+    Run a git command and yield its NUL-delimited output records as they arrive.
+    Meant for `-z` commands - memory stays bounded by the read buffer and
+    parsing overlaps with git still producing output.
+    stdin_data is only supported for commands that read all of stdin before
+    writing output (e.g. `git log --stdin`).
     """
-    if exclusions is None:
-        exclusions = DEFAULT_EXCLUSIONS
+    cmd = ['git', '-C', repo_path] + args
+    # stderr goes to a temp file: a second pipe nobody reads until stdout
+    # hits EOF would block git once it fills up
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                stdin=subprocess.PIPE if stdin_data is not None else None)
+        if stdin_data is not None:
+            proc.stdin.write(stdin_data)
+            proc.stdin.close()
+        completed = False
+        try:
+            yield from iter_nul_records(proc.stdout)
+            completed = True
+        finally:
+            proc.stdout.close()
+            # An early stop by the consumer is not a git failure
+            if proc.wait() != 0 and completed:
+                stderr_file.seek(0)
+                print(f"Git command failed: {' '.join(cmd)}")
+                print(f"Error: {stderr_file.read().decode('utf-8', 'replace')}")
+
+
+def decode_path(raw):
+    """Decode a raw git path, keeping undecodable bytes round-trippable."""
+    return raw.decode('utf-8', 'surrogateescape')
+
+
+# With -z every numstat entry is NUL-terminated and paths are never quoted.
+# The commit header shares a record with the commit's first numstat entry.
+LOG_ARGS = ['log', '-z', '--numstat', '--pretty=format:COMMIT:%H|%h|%aN|%ad|%s', '--date=short']
+
+
+def parse_commit_log(records):
+    """
+    Parse the NUL-delimited records of a `git log` run with LOG_ARGS.
+    Yields (sha, commit, files) per commit, where commit holds the
+    hash/author/date/message shown in the UI and files is a list of
+    [path, added, deleted] entries.
+    """
+    sha = commit = files = None
+    records = iter(records)
+    intern = sys.intern
+    paths = {}  # raw path bytes -> decoded, interned str
+    
+    for record in records:
+        if record[:7] == b'COMMIT:':
+            if commit is not None:
+                yield sha, commit, files
+            header, _, record = record.partition(b'\n')
+            
+            # Parse commit info: sha|hash|author|date|message
+            parts = header[7:].decode('utf-8', 'replace').split('|', 4)
+            if len(parts) >= 5:
+                sha = parts[0]
+                # Authors and dates repeat across thousands of commits, so
+                # intern them to keep one copy each and speed up hashing
+                commit = {
+                    'hash': parts[1],
+                    'author': intern(parts[2]),
+                    'date': intern(parts[3]),
+                    'message': parts[4]
+                }
+                files = []
+            else:
+                commit = None
+            
+            if not record:
+                continue
         
-    args = ['log', '--name-only', '--pretty=format:']
+        if commit is None:
+            continue
+        
+        # Numstat entry: added<TAB>deleted<TAB>path ('-' counts for binary files)
+        parts = record.split(b'\t', 2)
+        if len(parts) != 3:
+            continue
+        
+        added, deleted, raw_path = parts
+        if not raw_path:
+            # Rename/copy: the old and new paths follow as separate records
+            next(records, None)
+            raw_path = next(records, b'')
+        
+        try:
+            added = int(added) if added != b'-' else 0
+            deleted = int(deleted) if deleted != b'-' else 0
+        except ValueError:
+            continue
+        
+        # The same paths recur in thousands of commits - decode each only once
+        path = paths.get(raw_path)
+        if path is None:
+            path = paths[raw_path] = intern(decode_path(raw_path))
+        
+        files.append([path, added, deleted])
+    
+    if commit is not None:
+        yield sha, commit, files
+
+
+# Authors tracked per file as bits of an int; any past these go into sets, since
+# every |= on a wider mask copies the whole int
+BITSET_AUTHORS = 64
+
+if hasattr(int, 'bit_count'):  # Python 3.10+
+    popcount = int.bit_count
+else:
+    def popcount(mask):
+        """Number of set bits in mask."""
+        return bin(mask).count('1')
+
+
+def aggregate_metrics(commits, exclusions, tracked_files=None):
+    """
+    Fold parsed (sha, commit, files) tuples into per-file metrics.
+    tracked_files (already filtered by exclusions) pre-seeds the exclusion
+    decisions, so only historical paths no longer in the tree get checked.
+    Returns (revisions, churn, authors, commit_messages) dicts.
+    """
+    file_revisions = defaultdict(int)
+    file_churn = defaultdict(lambda: {'added': 0, 'deleted': 0})
+    file_authors = defaultdict(int)  # Bitset of the first BITSET_AUTHORS author ids
+    file_extra_authors = defaultdict(set)  # Ids of the authors after those
+    file_commits = defaultdict(list)
+    author_ids = {}
+    is_excluded = compile_exclusions(tuple(exclusions))
+    excluded = dict.fromkeys(tracked_files or (), False)  # filename -> exclusion result
+    
+    for _sha, commit, files in commits:
+        author = commit['author']
+        author_id = author_ids.get(author)
+        if author_id is None:
+            author_id = author_ids[author] = len(author_ids)
+        author_bit = 1 << author_id if author_id < BITSET_AUTHORS else 0
+        
+        for filename, added, deleted in files:
+            skip = excluded.get(filename)
+            if skip is None:
+                skip = excluded[filename] = is_excluded(filename)
+            if skip:
+                continue
+            
+            file_revisions[filename] += 1
+            churn = file_churn[filename]
+            churn['added'] += added
+            churn['deleted'] += deleted
+            if author_bit:
+                file_authors[filename] |= author_bit
+            else:
+                file_extra_authors[filename].add(author_id)
+            file_commits[filename].append(commit)
+    
+    authors = {f: popcount(file_authors.get(f, 0)) + len(file_extra_authors.get(f, ()))
+               for f in file_revisions}
+    return dict(file_revisions), dict(file_churn), authors, dict(file_commits)
+
+
+def list_commits(repo_path, since_date=None):
+    """List the full SHAs of the commits to analyze, newest first (None on failure)."""
+    args = ['rev-list', 'HEAD']
     
     if since_date:
         args.append(f'--after={since_date}')
     
     output = run_git_command(repo_path, args)
     if output is None:
-        return {}
+        return None
+    return output.split()
+
+
+def iter_commit_range(repo_path, shas):
+    """
+    Stream exactly the given commits through one `git log --stdin` run.
+    Yields (sha, commit, files) in the order of shas.
+    """
+    # --no-walk=unsorted shows exactly the given commits, in the given order
+    args = LOG_ARGS + ['--no-walk=unsorted', '--stdin']
+    records = stream_git(repo_path, args, stdin_data='\n'.join(shas).encode())
+    return parse_commit_log(records)
+
+
+def scan_commit_range(repo_path, shas):
+    """Parse one shard of commits into a list (module level so worker processes can run it)."""
+    return list(iter_commit_range(repo_path, shas))
+
+
+def scan_commits(repo_path, shas):
+    """
+    Parse the given commits, yielding (sha, commit, files) in the order of shas.
+    Large histories are split into one contiguous shard per core, each read
+    by its own git process, so pack decompression and parsing use every core.
+    Below PARALLEL_LOG_MIN_COMMITS a single streamed git process is cheaper.
+    """
+    if not shas:
+        return  # An empty --stdin would make git fall back to HEAD
     
-    file_revisions = defaultdict(int)
-    for line in output.split('\n'):
-        line = line.strip()
-        if line and not line.startswith('commit'):
-            if not should_exclude(line, exclusions):
-                file_revisions[line] += 1
+    workers = os.cpu_count() or 1
+    if len(shas) < PARALLEL_LOG_MIN_COMMITS or workers == 1:
+        yield from iter_commit_range(repo_path, shas)
+        return
     
-    return dict(file_revisions)
+    shard_size = -(-len(shas) // workers)  # Ceiling division
+    shards = [shas[i:i + shard_size] for i in range(0, len(shas), shard_size)]
+    repo_paths = [repo_path] * len(shards)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(scan_commit_range, repo_paths, shards))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # Worker processes unavailable on this platform - the git processes
+        # still run in parallel from threads
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(scan_commit_range, repo_paths, shards))
+    
+    for result in results:
+        yield from result
 
 
-def get_churn_data(repo_path, since_date=None, exclusions=None):
+def collect_all_metrics(repo_path, since_date=None, exclusions=None, tracked_files=None):
     """
-    Get lines added/deleted per file (code churn).
-    High churn indicates instability.
+    Collect revisions, churn, authors and commit history in a single pass.
+    Reads `git log -z --numstat` once instead of re-walking history per metric.
+    Exclusions are applied while aggregating, not as git pathspecs: a
+    pathspec changes which side of a rename git pairs up, and the cached
+    path must see the same history.
+    Returns (revisions, churn, authors, commit_messages) dicts.
     """
     if exclusions is None:
         exclusions = DEFAULT_EXCLUSIONS
-        
-    args = ['log', '--numstat', '--pretty=format:']
     
-    if since_date:
-        args.append(f'--after={since_date}')
-    
-    output = run_git_command(repo_path, args)
-    if output is None:
-        return {}
-    
-    file_churn = defaultdict(lambda: {'added': 0, 'deleted': 0})
+    shas = list_commits(repo_path, since_date)
+    if shas is None:
+        return {}, {}, {}, {}
     
-    for line in output.split('\n'):
-        parts = line.split('\t')
-        if len(parts) == 3:
-            added, deleted, filename = parts
-            if should_exclude(filename, exclusions):
-                continue
-            try:
-                file_churn[filename]['added'] += int(added) if added != '-' else 0
-                file_churn[filename]['deleted'] += int(deleted) if deleted != '-' else 0
-            except ValueError:
-                continue
-    
-    return dict(file_churn)
+    commits = scan_commits(repo_path, shas)
+    return aggregate_metrics(commits, exclusions, tracked_files)
 
 
-def get_author_count(repo_path, since_date=None, exclusions=None):
+def collect_all_metrics_incremental(repo_path, since_date=None, exclusions=None,
+                                    tracked_files=None):
     """
-    Get the number of distinct authors per file.
-    More authors = more coordination complexity.
+    Same as collect_all_metrics, but backed by the per-commit cache.
+    Only commits that have never been analyzed are read from git; everything
+    else comes from COMMIT_CACHE_DIR, so new commits cost time proportional
+    to the new history only. Cached commits are shared by every exclusion
+    list.
     """
     if exclusions is None:
         exclusions = DEFAULT_EXCLUSIONS
-        
-    args = ['log', '--name-only', '--pretty=format:%aN']
     
-    if since_date:
-        args.append(f'--after={since_date}')
+    shas = list_commits(repo_path, since_date)
+    if shas is None:
+        return {}, {}, {}, {}
     
-    output = run_git_command(repo_path, args)
-    if output is None:
-        return {}
+    os.makedirs(COMMIT_CACHE_DIR, exist_ok=True)
+    cached_shas = {name[:-5] for name in os.listdir(COMMIT_CACHE_DIR) if name.endswith('.json')}
+    missing = [sha for sha in shas if sha not in cached_shas]
+    print(f"   Reusing {len(shas) - len(missing)} cached commits, reading {len(missing)} new ones")
     
-    file_authors = defaultdict(set)
-    current_author = None
+    fresh = {}
+    for sha, commit, files in scan_commits(repo_path, missing):
+        fresh[sha] = (commit, files)
+        save_commit_cache(sha, commit, files)
     
-    for line in output.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        # If line contains typical file path characters, it's likely a file
-        if '/' in line or '.' in line:
-            if current_author and not should_exclude(line, exclusions):
-                file_authors[line].add(current_author)
-        else:
-            current_author = line
+    def iter_commits():
+        # Walk in rev-list order so per-file commit lists stay newest-first
+        for sha in shas:
+            entry = fresh.get(sha) or load_commit_cache(sha)
+            if entry is not None:
+                yield sha, entry[0], entry[1]
     
-    return {f: len(authors) for f, authors in file_authors.items()}
+    return aggregate_metrics(iter_commits(), exclusions, tracked_files)
 
 
-def get_commit_messages(repo_path, since_date=None, exclusions=None):
+def count_file_lines(full_path):
     """
-    Get commit messages and hashes for each file.
-    Returns a dict mapping filepath to list of {hash, message, author, date} dicts.
+    Count the lines in a file by counting newline bytes in 1 MB chunks.
+    Returns None for missing, non-regular, unreadable or oversized files.
     """
+    try:
+        st = os.stat(full_path)
+        if not stat.S_ISREG(st.st_mode) or st.st_size > MAX_LOC_FILE_SIZE:
+            return None
+        
+        lines = 0
+        last = b'\n'
+        with open(full_path, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                lines += chunk.count(b'\n')
+                last = chunk[-1:]
+        
+        # A final line without a trailing newline still counts
+        if last != b'\n':
+            lines += 1
+        return lines
+    except OSError:
+        return None
+
+
+def list_tracked_files(repo_path, exclusions=None):
+    """List the files currently tracked by git, minus excluded ones."""
     if exclusions is None:
         exclusions = DEFAULT_EXCLUSIONS
     
-    # Get commits with files changed
-    args = ['log', '--name-only', '--pretty=format:COMMIT:%h|%aN|%ad|%s', '--date=short']
-    
-    if since_date:
-        args.append(f'--after={since_date}')
-    
-    output = run_git_command(repo_path, args)
-    if output is None:
-        return {}
+    is_excluded = compile_exclusions(tuple(exclusions))
     
-    file_commits = defaultdict(list)
-    current_commit = None
-    
-    for line in output.split('\n'):
-        line = line.strip()
-        if not line:
+    filepaths = []
+    for filepath in stream_git(repo_path, ['ls-files', '-z']):
+        if not filepath:
             continue
+        filepath = decode_path(filepath)
         
-        if line.startswith('COMMIT:'):
-            # Parse commit info: hash|author|date|message
-            parts = line[7:].split('|', 3)
-            if len(parts) >= 4:
-                current_commit = {
-                    'hash': parts[0],
-                    'author': parts[1],
-                    'date': parts[2],
-                    'message': parts[3]
-                }
-            else:
-                current_commit = None
-        elif current_commit and (('/' in line) or ('.' in line)):
-            # This is a file path
-            if not should_exclude(line, exclusions):
-                # Add commit to this file's history
-                file_commits[line].append(current_commit.copy())
+        # Skip excluded files
+        if is_excluded(filepath):
+            continue
+        
+        filepaths.append(filepath)
     
-    return dict(file_commits)
+    return filepaths
 
 
-def count_lines_of_code(repo_path, exclusions=None):
+def count_lines_of_code(repo_path, exclusions=None, tracked_files=None):
     """
     Count lines of code for each file currently in the repository.
     This approximates complexity.
     """
-    if exclusions is None:
-        exclusions = DEFAULT_EXCLUSIONS
-        
     file_loc = {}
     
     # Get list of tracked files
-    output = run_git_command(repo_path, ['ls-files'])
-    if output is None:
-        return {}
+    filepaths = tracked_files
+    if filepaths is None:
+        filepaths = list_tracked_files(repo_path, exclusions)
     
-    for filepath in output.split('\n'):
-        filepath = filepath.strip()
-        if not filepath:
-            continue
-        
-        # Skip excluded files
-        if should_exclude(filepath, exclusions):
-            continue
-        
-        full_path = os.path.join(repo_path, filepath)
-        
-        # Skip binary files and non-existent files
-        if not os.path.exists(full_path) or not os.path.isfile(full_path):
-            continue
-        
-        try:
-            with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = len(f.readlines())
-                file_loc[filepath] = lines
-        except Exception:
-            continue
+    # Counting is independent per file, so spread it across all cores
+    full_paths = [os.path.join(repo_path, filepath) for filepath in filepaths]
+    try:
+        with ProcessPoolExecutor() as executor:
+            counts = list(executor.map(count_file_lines, full_paths, chunksize=64))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # Worker processes unavailable on this platform - fall back to threads
+        with ThreadPoolExecutor() as executor:
+            counts = list(executor.map(count_file_lines, full_paths))
+    
+    for filepath, lines in zip(filepaths, counts):
+        if lines is not None:
+            file_loc[filepath] = lines
     
     return file_loc
 
@@ -531,22 +859,20 @@ def calculate_hotspots(revisions, loc, churn=None, authors=None):
     Files with high revisions AND high complexity are the real hotspots.
     """
     hotspots = []
+    churn = churn or {}
+    authors = authors or {}
     
     # Get max values for normalization
     max_revisions = max(revisions.values()) if revisions else 1
     max_loc = max(loc.values()) if loc else 1
     
-    # Only analyze files that exist in both datasets
-    common_files = set(revisions.keys()) & set(loc.keys())
+    # Only analyze files that exist in both datasets, skipping very small files.
+    # Key views intersect directly without copying either dict into a set.
+    candidates = [(filepath, revisions[filepath], loc[filepath])
+                  for filepath in revisions.keys() & loc.keys()
+                  if loc[filepath] >= 10]
     
-    for filepath in common_files:
-        rev_count = revisions[filepath]
-        lines = loc[filepath]
-        
-        # Skip very small files
-        if lines < 10:
-            continue
-        
+    for filepath, rev_count, lines in candidates:
         # Normalize scores (0-1 scale)
         norm_revisions = rev_count / max_revisions
         norm_loc = lines / max_loc
@@ -564,18 +890,21 @@ def calculate_hotspots(revisions, loc, churn=None, authors=None):
         }
         
         # Add optional data if available
-        if churn and filepath in churn:
-            entry['churn_added'] = churn[filepath]['added']
-            entry['churn_deleted'] = churn[filepath]['deleted']
-            entry['total_churn'] = churn[filepath]['added'] + churn[filepath]['deleted']
+        file_churn = churn.get(filepath)
+        if file_churn is not None:
+            added, deleted = file_churn['added'], file_churn['deleted']
+            entry['churn_added'] = added
+            entry['churn_deleted'] = deleted
+            entry['total_churn'] = added + deleted
         
-        if authors and filepath in authors:
-            entry['authors'] = authors[filepath]
+        file_authors = authors.get(filepath)
+        if file_authors is not None:
+            entry['authors'] = file_authors
         
         hotspots.append(entry)
     
     # Sort by hotspot score descending
-    hotspots.sort(key=lambda x: x['hotspot_score'], reverse=True)
+    hotspots.sort(key=operator.itemgetter('hotspot_score'), reverse=True)
     
     return hotspots
 
@@ -592,7 +921,9 @@ def build_hierarchy(hotspots):
         current = root
         
         # Navigate/create directory structure
-        for i, part in enumerate(path_parts[:-1]):
+        for part in path_parts[:-1]:
+            # Directory names repeat across many files - share one string each
+            part = sys.intern(part)
             if part not in current['children']:
                 current['children'][part] = {'name': part, 'children': {}}
             current = current['children'][part]
@@ -616,1480 +947,190 @@ def build_hierarchy(hotspots):
         if 'commits' in entry:
             current['children'][filename]['commits'] = entry['commits']
     
-    # Convert children dicts to lists for D3
-    def convert_to_list(node):
-        if 'children' in node and isinstance(node['children'], dict):
-            children_list = []
-            for child_node in node['children'].values():
-                children_list.append(convert_to_list(child_node))
-            if children_list:
-                node['children'] = children_list
-            else:
-                del node['children']
-        return node
+    # Convert children dicts to lists for D3, using an explicit stack so
+    # deeply nested trees can't hit the recursion limit
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        children = node.get('children')
+        if not isinstance(children, dict):
+            continue
+        if children:
+            node['children'] = list(children.values())
+            stack.extend(node['children'])
+        else:
+            del node['children']
     
-    return convert_to_list(root)
+    return root
 
 
 def generate_html(output_dir):
-    """Generate the D3.js visualization HTML file."""
-    
-    html_content = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Code Hotspot Analysis</title>
-    <script src="https://d3js.org/d3.v7.min.js"></script>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=Outfit:wght@300;500;700&display=swap');
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Outfit', sans-serif;
-            background: linear-gradient(135deg, #0f0f1a 0%, #1a1a2e 50%, #16213e 100%);
-            min-height: 100vh;
-            color: #e0e0e0;
-            overflow-x: hidden;
-        }
-        
-        .header {
-            padding: 2rem 3rem;
-            background: linear-gradient(180deg, rgba(15, 15, 26, 0.95) 0%, rgba(15, 15, 26, 0) 100%);
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            z-index: 100;
-        }
-        
-        h1 {
-            font-size: 2.5rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #f72585 0%, #7209b7 50%, #3a0ca3 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            letter-spacing: -0.02em;
-        }
-        
-        .subtitle {
-            font-size: 1rem;
-            color: #888;
-            margin-top: 0.5rem;
-            font-weight: 300;
-        }
-        
-        .container {
-            display: flex;
-            padding-top: 120px;
-            padding-bottom: 130px; /* Space for date filter */
-            min-height: 100vh;
-        }
-        
-        .visualization {
-            flex: 1;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 1rem;
-            margin-right: 380px;
-            overflow: hidden;
-        }
-        
-        #chart {
-            background: radial-gradient(ellipse at center, rgba(58, 12, 163, 0.1) 0%, transparent 70%);
-            border-radius: 20px;
-            overflow: hidden;
-        }
-        
-        #chart svg {
-            display: block;
-        }
-        
-        .sidebar {
-            width: 380px;
-            min-width: 280px;
-            max-width: 800px;
-            background: rgba(26, 26, 46, 0.8);
-            backdrop-filter: blur(20px);
-            border-left: 1px solid rgba(255, 255, 255, 0.05);
-            padding: 2rem;
-            overflow-y: auto;
-            max-height: calc(100vh - 120px);
-            position: fixed;
-            right: 0;
-            top: 120px;
-            bottom: 0;
-            transition: width 0s;
-        }
-        
-        .sidebar-resizer {
-            position: absolute;
-            left: 0;
-            top: 0;
-            bottom: 0;
-            width: 6px;
-            cursor: ew-resize;
-            background: transparent;
-            transition: background 0.2s ease;
-        }
-        
-        .sidebar-resizer:hover,
-        .sidebar-resizer.active {
-            background: linear-gradient(180deg, #f72585 0%, #7209b7 100%);
-        }
-        
-        .file-detail-view {
-            display: none;
-        }
-        
-        .file-detail-view.active {
-            display: block;
-        }
-        
-        .main-view {
-            display: block;
-        }
-        
-        .main-view.hidden {
-            display: none;
-        }
-        
-        .file-header {
-            margin-bottom: 1.5rem;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-        
-        .file-name {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 1rem;
-            color: #f72585;
-            word-break: break-all;
-            margin-bottom: 0.75rem;
-        }
-        
-        .file-stats {
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-            font-size: 0.8rem;
-            color: #888;
-        }
-        
-        .file-stats span {
-            background: rgba(255, 255, 255, 0.05);
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-        }
-        
-        .back-button {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-size: 0.85rem;
-            color: #4cc9f0;
-            cursor: pointer;
-            margin-bottom: 1rem;
-            padding: 0.5rem 0;
-            transition: color 0.2s ease;
-        }
-        
-        .back-button:hover {
-            color: #f72585;
-        }
-        
-        .commits-header {
-            font-size: 0.85rem;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            color: #666;
-            margin-bottom: 1rem;
-        }
-        
-        .commit-list {
-            display: flex;
-            flex-direction: column;
-            gap: 0.75rem;
-        }
-        
-        .commit-item {
-            background: rgba(255, 255, 255, 0.02);
-            border: 1px solid rgba(255, 255, 255, 0.05);
-            border-radius: 8px;
-            padding: 1rem;
-            transition: all 0.2s ease;
-        }
-        
-        .commit-item:hover {
-            background: rgba(255, 255, 255, 0.05);
-            border-color: rgba(255, 255, 255, 0.1);
-        }
-        
-        .commit-hash {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.75rem;
-            color: #4cc9f0;
-            margin-bottom: 0.5rem;
-        }
-        
-        .commit-message {
-            font-size: 0.9rem;
-            color: #e0e0e0;
-            line-height: 1.4;
-            margin-bottom: 0.5rem;
-        }
-        
-        .commit-meta {
-            font-size: 0.75rem;
-            color: #666;
-            display: flex;
-            gap: 1rem;
-        }
-        
-        .no-commits {
-            color: #666;
-            font-size: 0.9rem;
-            font-style: italic;
-            padding: 1rem;
-            text-align: center;
-        }
-        
-        .legend {
-            margin-bottom: 2rem;
-        }
-        
-        .legend h3 {
-            font-size: 0.85rem;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            color: #666;
-            margin-bottom: 1rem;
-        }
-        
-        .legend-gradient {
-            height: 20px;
-            background: linear-gradient(90deg, #2d6a4f, #40916c, #95d5b2, #ffd60a, #ff9500, #f72585, #b5179e);
-            border-radius: 10px;
-            margin-bottom: 0.5rem;
-        }
-        
-        .legend-labels {
-            display: flex;
-            justify-content: space-between;
-            font-size: 0.75rem;
-            color: #888;
-            font-family: 'JetBrains Mono', monospace;
-        }
-        
-        .stats {
-            margin-bottom: 2rem;
-        }
-        
-        .stat-card {
-            background: rgba(255, 255, 255, 0.03);
-            border: 1px solid rgba(255, 255, 255, 0.05);
-            border-radius: 12px;
-            padding: 1.25rem;
-            margin-bottom: 1rem;
-        }
-        
-        .stat-label {
-            font-size: 0.75rem;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            color: #666;
-            margin-bottom: 0.5rem;
-        }
-        
-        .stat-value {
-            font-size: 2rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #4cc9f0 0%, #4361ee 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .top-hotspots h3 {
-            font-size: 0.85rem;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            color: #666;
-            margin-bottom: 1rem;
-        }
-        
-        .hotspot-item {
-            background: rgba(255, 255, 255, 0.02);
-            border: 1px solid rgba(255, 255, 255, 0.05);
-            border-radius: 8px;
-            padding: 1rem;
-            margin-bottom: 0.75rem;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-        
-        .hotspot-item:hover {
-            background: rgba(247, 37, 133, 0.1);
-            border-color: rgba(247, 37, 133, 0.3);
-            transform: translateX(4px);
-        }
-        
-        .hotspot-name {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.85rem;
-            color: #f0f0f0;
-            margin-bottom: 0.5rem;
-            word-break: break-all;
-        }
-        
-        .hotspot-meta {
-            display: flex;
-            gap: 1rem;
-            font-size: 0.75rem;
-            color: #888;
-        }
-        
-        .hotspot-meta span {
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }
-        
-        .tooltip {
-            position: fixed;
-            background: rgba(15, 15, 26, 0.95);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(247, 37, 133, 0.3);
-            border-radius: 12px;
-            padding: 1rem 1.25rem;
-            pointer-events: none;
-            z-index: 1000;
-            max-width: 350px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
-        }
-        
-        .tooltip-title {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.9rem;
-            color: #f72585;
-            margin-bottom: 0.75rem;
-            word-break: break-all;
-        }
-        
-        .tooltip-row {
-            display: flex;
-            justify-content: space-between;
-            font-size: 0.8rem;
-            padding: 0.25rem 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-        }
-        
-        .tooltip-row:last-child {
-            border-bottom: none;
-        }
-        
-        .tooltip-label {
-            color: #888;
-        }
-        
-        .tooltip-value {
-            font-family: 'JetBrains Mono', monospace;
-            color: #4cc9f0;
-        }
-        
-        circle {
-            transition: all 0.2s ease;
-        }
-        
-        circle:hover {
-            filter: brightness(1.3);
-        }
-        
-        .breadcrumb {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.8rem;
-            color: #666;
-            padding: 0.75rem 1rem;
-            background: rgba(255, 255, 255, 0.03);
-            border-radius: 8px;
-            margin-bottom: 1.5rem;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-        
-        .breadcrumb:hover {
-            color: #4cc9f0;
-            background: rgba(67, 97, 238, 0.1);
-        }
-        
-        .instructions {
-            font-size: 0.8rem;
-            color: #666;
-            line-height: 1.6;
-            padding: 1rem;
-            background: rgba(255, 255, 255, 0.02);
-            border-radius: 8px;
-            margin-top: 1.5rem;
-        }
-        
-        .instructions strong {
-            color: #888;
-        }
-        
-        /* Date Range Slider */
-        .date-filter-container {
-            position: fixed;
-            bottom: 0;
-            left: 0;
-            right: 380px;
-            background: rgba(15, 15, 26, 0.95);
-            backdrop-filter: blur(20px);
-            border-top: 1px solid rgba(255, 255, 255, 0.1);
-            padding: 1rem 2rem;
-            z-index: 100;
-        }
-        
-        .date-filter-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 0.75rem;
-        }
-        
-        .date-filter-title {
-            font-size: 0.85rem;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            color: #666;
-        }
-        
-        .date-filter-range {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.9rem;
-            color: #4cc9f0;
-        }
-        
-        .date-filter-controls {
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        }
-        
-        .date-input-group {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        
-        .date-input-group label {
-            font-size: 0.75rem;
-            color: #666;
-            text-transform: uppercase;
-        }
-        
-        .date-input {
-            background: rgba(255, 255, 255, 0.05);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 6px;
-            padding: 0.5rem 0.75rem;
-            color: #f0f0f0;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.85rem;
-            width: 130px;
-        }
-        
-        .date-input:focus {
-            outline: none;
-            border-color: #4cc9f0;
-        }
-        
-        .slider-container {
-            flex: 1;
-            padding: 0 1rem;
-        }
-        
-        .dual-slider {
-            position: relative;
-            height: 30px;
-        }
-        
-        .slider-track {
-            position: absolute;
-            top: 50%;
-            transform: translateY(-50%);
-            width: 100%;
-            height: 6px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 3px;
-        }
-        
-        .slider-range {
-            position: absolute;
-            top: 50%;
-            transform: translateY(-50%);
-            height: 6px;
-            background: linear-gradient(90deg, #4361ee, #f72585);
-            border-radius: 3px;
-        }
-        
-        .range-slider {
-            position: absolute;
-            width: 100%;
-            height: 6px;
-            top: 50%;
-            transform: translateY(-50%);
-            -webkit-appearance: none;
-            appearance: none;
-            background: transparent;
-            pointer-events: none;
-        }
-        
-        .range-slider::-webkit-slider-thumb {
-            -webkit-appearance: none;
-            appearance: none;
-            width: 18px;
-            height: 18px;
-            background: #f0f0f0;
-            border-radius: 50%;
-            cursor: pointer;
-            pointer-events: auto;
-            box-shadow: 0 2px 6px rgba(0, 0, 0, 0.3);
-            transition: transform 0.15s ease, background 0.15s ease;
-        }
-        
-        .range-slider::-webkit-slider-thumb:hover {
-            transform: scale(1.2);
-            background: #4cc9f0;
-        }
-        
-        .range-slider::-moz-range-thumb {
-            width: 18px;
-            height: 18px;
-            background: #f0f0f0;
-            border-radius: 50%;
-            cursor: pointer;
-            pointer-events: auto;
-            box-shadow: 0 2px 6px rgba(0, 0, 0, 0.3);
-            border: none;
-        }
-        
-        .filter-stats {
-            display: flex;
-            gap: 1.5rem;
-            margin-top: 0.5rem;
-            font-size: 0.8rem;
-            color: #888;
-        }
-        
-        .filter-stats span {
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }
-        
-        .filter-stats .value {
-            color: #f0f0f0;
-            font-family: 'JetBrains Mono', monospace;
-        }
-        
-        .reset-filter-btn {
-            background: rgba(247, 37, 133, 0.2);
-            border: 1px solid rgba(247, 37, 133, 0.3);
-            color: #f72585;
-            padding: 0.4rem 0.75rem;
-            border-radius: 6px;
-            font-size: 0.75rem;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-        
-        .reset-filter-btn:hover {
-            background: rgba(247, 37, 133, 0.3);
-            border-color: #f72585;
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Code Hotspot Analysis</h1>
-        <p class="subtitle">Visualizing areas of high change frequency & complexity</p>
-    </div>
-    
-    <div class="container">
-        <div class="visualization">
-            <div id="chart"></div>
-        </div>
-        
-        <div class="sidebar" id="sidebar">
-            <div class="sidebar-resizer" id="sidebar-resizer"></div>
-            
-            <!-- Main View (default) -->
-            <div class="main-view" id="main-view">
-                <div class="breadcrumb" id="breadcrumb" onclick="zoomToRoot()">
-                    📁 root
-                </div>
-                
-                <div class="legend">
-                    <h3>Hotspot Intensity</h3>
-                    <div class="legend-gradient"></div>
-                    <div class="legend-labels">
-                        <span>Cool (Low)</span>
-                        <span>Hot (High)</span>
-                    </div>
-                </div>
-                
-                <div class="stats">
-                    <div class="stat-card">
-                        <div class="stat-label">Total Files Analyzed</div>
-                        <div class="stat-value" id="total-files">-</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Total Revisions</div>
-                        <div class="stat-value" id="total-revisions">-</div>
-                    </div>
-                </div>
-                
-                <div class="top-hotspots">
-                    <h3>🔥 Top Hotspots</h3>
-                    <div id="hotspot-list"></div>
-                </div>
-                
-                <div class="instructions">
-                    <strong>How to read this:</strong><br>
-                    • Circle <strong>size</strong> = lines of code<br>
-                    • Circle <strong>color</strong> = change frequency (red = high)<br>
-                    • <strong>Click</strong> on file to see commit history<br>
-                    • <strong>Click</strong> on directory to zoom in<br>
-                    • <strong>Scroll wheel</strong> to zoom in/out freely<br>
-                    • <strong>Drag</strong> to pan around<br>
-                    • <strong>Double-click</strong> to reset view
-                </div>
-            </div>
-            
-            <!-- File Detail View (shown when clicking a file) -->
-            <div class="file-detail-view" id="file-detail-view">
-                <div class="back-button" id="back-to-main">
-                    ← Back to overview
-                </div>
-                
-                <div class="file-header">
-                    <div class="file-name" id="detail-file-name">-</div>
-                    <div class="file-stats" id="detail-file-stats"></div>
-                </div>
-                
-                <div class="commits-header">💬 Commit History</div>
-                <div class="commit-list" id="commit-list"></div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="tooltip" id="tooltip" style="display: none;"></div>
-    
-    <!-- Date Range Filter -->
-    <div class="date-filter-container" id="date-filter">
-        <div class="date-filter-header">
-            <span class="date-filter-title">📅 Filter by Date Range</span>
-            <span class="date-filter-range" id="date-range-display">Loading...</span>
-            <button class="reset-filter-btn" id="reset-filter-btn">Reset</button>
-        </div>
-        <div class="date-filter-controls">
-            <div class="date-input-group">
-                <label>From</label>
-                <input type="date" class="date-input" id="start-date-input">
-            </div>
-            <div class="slider-container">
-                <div class="dual-slider">
-                    <div class="slider-track"></div>
-                    <div class="slider-range" id="slider-range"></div>
-                    <input type="range" class="range-slider" id="start-slider" min="0" max="100" value="0">
-                    <input type="range" class="range-slider" id="end-slider" min="0" max="100" value="100">
-                </div>
-            </div>
-            <div class="date-input-group">
-                <label>To</label>
-                <input type="date" class="date-input" id="end-date-input">
-            </div>
-        </div>
-        <div class="filter-stats">
-            <span>Files in range: <span class="value" id="filtered-files">-</span></span>
-            <span>Commits in range: <span class="value" id="filtered-commits">-</span></span>
-            <span>Authors in range: <span class="value" id="filtered-authors">-</span></span>
-        </div>
-    </div>
-
-    <script>
-        // Load the data
-        d3.json('hotspot_data.json').then(function(rawData) {
-            const data = rawData.hierarchy;
-            const hotspots = rawData.hotspots;
-            const originalHotspots = JSON.parse(JSON.stringify(hotspots)); // Deep copy for reset
-            
-            // Update stats
-            document.getElementById('total-files').textContent = hotspots.length.toLocaleString();
-            document.getElementById('total-revisions').textContent = 
-                hotspots.reduce((sum, h) => sum + h.revisions, 0).toLocaleString();
-            
-            // Populate top hotspots list
-            const hotspotList = document.getElementById('hotspot-list');
-            hotspots.slice(0, 10).forEach((h, i) => {
-                const item = document.createElement('div');
-                item.className = 'hotspot-item';
-                item.innerHTML = `
-                    <div class="hotspot-name">${h.file}</div>
-                    <div class="hotspot-meta">
-                        <span>📝 ${h.revisions} revisions</span>
-                        <span>📄 ${h.lines} lines</span>
-                    </div>
-                `;
-                item.onclick = () => highlightFile(h.file);
-                hotspotList.appendChild(item);
-            });
-            
-            // Set up the visualization - fill available space
-            const sidebarWidth = 380;
-            const headerHeight = 120;
-            const bottomBarHeight = 130;
-            const padding = 40;
-            
-            const width = window.innerWidth - sidebarWidth - padding;
-            const height = window.innerHeight - headerHeight - bottomBarHeight - padding;
-            
-            // Color scale based on revision intensity
-            const colorScale = d3.scaleSequential()
-                .domain([0, 1])
-                .interpolator(d3.interpolateRgbBasis([
-                    '#2d6a4f', '#40916c', '#74c69d', 
-                    '#ffd60a', '#ff9500', 
-                    '#f72585', '#b5179e'
-                ]));
-            
-            // Create the pack layout
-            const pack = d3.pack()
-                .size([width - 4, height - 4])
-                .padding(3);
-            
-            // Create hierarchy
-            const root = d3.hierarchy(data)
-                .sum(d => d.size || 0)
-                .sort((a, b) => (b.data.norm_revisions || 0) - (a.data.norm_revisions || 0));
-            
-            pack(root);
-            
-            // Create SVG with zoom behavior
-            const svg = d3.select('#chart')
-                .append('svg')
-                .attr('width', width)
-                .attr('height', height)
-                .attr('viewBox', [-width / 2, -height / 2, width, height])
-                .style('cursor', 'grab');
-            
-            // Create main group that will be transformed
-            const g = svg.append('g');
-            
-            // Track state
-            let focus = root;
-            let view;
-            let currentTransform = d3.zoomIdentity;
-            
-            // Set up D3 zoom behavior for scroll wheel zoom and panning
-            const zoomBehavior = d3.zoom()
-                .scaleExtent([0.5, 10])  // Min and max zoom levels
-                .on('start', function(event) {
-                    svg.style('cursor', 'grabbing');
-                })
-                .on('zoom', function(event) {
-                    currentTransform = event.transform;
-                    g.attr('transform', event.transform);
-                })
-                .on('end', function(event) {
-                    svg.style('cursor', 'grab');
-                });
-            
-            // Apply zoom behavior to SVG
-            svg.call(zoomBehavior);
-            
-            // Double-click to reset zoom
-            svg.on('dblclick.zoom', null);  // Disable default double-click zoom
-            svg.on('dblclick', function(event) {
-                event.preventDefault();
-                // Reset to initial view
-                svg.transition()
-                    .duration(750)
-                    .call(zoomBehavior.transform, d3.zoomIdentity);
-                focus = root;
-                zoomToCircle([root.x, root.y, root.r * 2]);
-                updateBreadcrumb(root);
-            });
-            
-            // Create circles
-            const node = g.append('g')
-                .selectAll('circle')
-                .data(root.descendants().slice(1))
-                .join('circle')
-                .attr('fill', d => {
-                    if (d.children) {
-                        // Directory - darker shade
-                        return 'rgba(30, 30, 50, 0.8)';
-                    }
-                    // File - color based on hotspot intensity
-                    const intensity = d.data.norm_revisions || 0;
-                    return colorScale(intensity);
-                })
-                .attr('stroke', d => d.children ? 'rgba(255,255,255,0.1)' : 'none')
-                .attr('stroke-width', 1)
-                .style('opacity', d => d.children ? 0.7 : 0.85)
-                .on('mouseover', function(event, d) {
-                    d3.select(this).style('opacity', 1);
-                    showTooltip(event, d);
-                })
-                .on('mousemove', function(event) {
-                    moveTooltip(event);
-                })
-                .on('mouseout', function(d) {
-                    d3.select(this).style('opacity', d => d.children ? 0.7 : 0.85);
-                    hideTooltip();
-                })
-                .on('click', (event, d) => {
-                    event.stopPropagation();
-                    if (d.children) {
-                        // Zoom into directory
-                        focus = d;
-                        zoomToCircle([d.x, d.y, d.r * 2]);
-                        updateBreadcrumb(d);
-                        
-                        // Also adjust the D3 zoom transform to center on this node
-                        const scale = Math.min(width, height) / (d.r * 4);
-                        const x = -d.x * scale + width / 2;
-                        const y = -d.y * scale + height / 2;
-                        
-                        svg.transition()
-                            .duration(750)
-                            .call(zoomBehavior.transform, 
-                                  d3.zoomIdentity.translate(x - width/2, y - height/2).scale(scale));
-                    } else {
-                        // File clicked - show commit history
-                        showFileDetail(d);
-                    }
-                });
-            
-            // Labels for directories
-            const label = g.append('g')
-                .style('font-family', 'JetBrains Mono, monospace')
-                .attr('pointer-events', 'none')
-                .attr('text-anchor', 'middle')
-                .selectAll('text')
-                .data(root.descendants())
-                .join('text')
-                .style('fill', '#fff')
-                .style('fill-opacity', d => d.parent === root ? 1 : 0)
-                .style('display', d => d.parent === root ? 'inline' : 'none')
-                .style('font-size', d => d.children ? '11px' : '9px')
-                .text(d => d.data.name.length > 15 ? d.data.name.slice(0, 12) + '...' : d.data.name);
-            
-            // Initial view - scale to fill horizontal space better
-            const initialDiameter = root.r * 2;
-            const horizontalScale = width / initialDiameter;
-            const verticalScale = height / initialDiameter;
-            const initialScale = Math.max(horizontalScale, verticalScale) * 0.95; // Use larger scale, with small margin
-            
-            zoomToCircle([root.x, root.y, root.r * 2]);
-            
-            // Apply initial scale transform if visualization is wider than tall
-            if (width > height) {
-                const scaleRatio = width / height;
-                svg.call(zoomBehavior.transform, d3.zoomIdentity.scale(scaleRatio * 0.85));
-            }
-            
-            function zoomToCircle(v) {
-                const k = Math.min(width, height) / v[2];
-                view = v;
-                
-                label.attr('transform', d => `translate(${(d.x - v[0]) * k},${(d.y - v[1]) * k})`);
-                node.attr('transform', d => `translate(${(d.x - v[0]) * k},${(d.y - v[1]) * k})`);
-                node.attr('r', d => d.r * k);
-            }
-            
-            // Click on SVG background to zoom out and show main view
-            svg.on('click', (event) => {
-                // Always return to main view when clicking background
-                showMainView();
-                
-                if (focus !== root && focus.parent) {
-                    focus = focus.parent;
-                    zoomToCircle([focus.x, focus.y, focus.r * 2]);
-                    updateBreadcrumb(focus);
-                    
-                    // Adjust D3 zoom transform
-                    const scale = focus === root ? 1 : Math.min(width, height) / (focus.r * 4);
-                    const x = -focus.x * scale + width / 2;
-                    const y = -focus.y * scale + height / 2;
-                    
-                    svg.transition()
-                        .duration(750)
-                        .call(zoomBehavior.transform, 
-                              focus === root ? d3.zoomIdentity : 
-                              d3.zoomIdentity.translate(x - width/2, y - height/2).scale(scale));
-                }
-            });
-            
-            // Make zoom to root globally available
-            window.zoomToRoot = function() {
-                focus = root;
-                zoomToCircle([root.x, root.y, root.r * 2]);
-                updateBreadcrumb(root);
-                svg.transition()
-                    .duration(750)
-                    .call(zoomBehavior.transform, d3.zoomIdentity);
-            };
-            
-            function updateBreadcrumb(d) {
-                const path = [];
-                let current = d;
-                while (current) {
-                    path.unshift(current.data.name);
-                    current = current.parent;
-                }
-                document.getElementById('breadcrumb').textContent = '📁 ' + path.join(' / ');
-            }
-            
-            function showTooltip(event, d) {
-                const tooltip = document.getElementById('tooltip');
-                let content = `<div class="tooltip-title">${d.data.fullPath || d.data.name}</div>`;
-                
-                if (!d.children) {
-                    content += `
-                        <div class="tooltip-row">
-                            <span class="tooltip-label">Lines of Code</span>
-                            <span class="tooltip-value">${(d.data.size || 0).toLocaleString()}</span>
-                        </div>
-                        <div class="tooltip-row">
-                            <span class="tooltip-label">Revisions</span>
-                            <span class="tooltip-value">${d.data.revisions || 0}</span>
-                        </div>
-                        <div class="tooltip-row">
-                            <span class="tooltip-label">Hotspot Score</span>
-                            <span class="tooltip-value">${((d.data.hotspot_score || 0) * 100).toFixed(1)}%</span>
-                        </div>
-                    `;
-                    if (d.data.authors) {
-                        content += `
-                            <div class="tooltip-row">
-                                <span class="tooltip-label">Authors</span>
-                                <span class="tooltip-value">${d.data.authors}</span>
-                            </div>
-                        `;
-                    }
-                    if (d.data.churn) {
-                        content += `
-                            <div class="tooltip-row">
-                                <span class="tooltip-label">Total Churn</span>
-                                <span class="tooltip-value">${d.data.churn.toLocaleString()} lines</span>
-                            </div>
-                        `;
-                    }
-                } else {
-                    const descendants = d.descendants().filter(n => !n.children);
-                    content += `
-                        <div class="tooltip-row">
-                            <span class="tooltip-label">Files</span>
-                            <span class="tooltip-value">${descendants.length}</span>
-                        </div>
-                        <div class="tooltip-row">
-                            <span class="tooltip-label">Total Lines</span>
-                            <span class="tooltip-value">${d.value.toLocaleString()}</span>
-                        </div>
-                    `;
-                }
-                
-                tooltip.innerHTML = content;
-                tooltip.style.display = 'block';
-                moveTooltip(event);
-            }
-            
-            function moveTooltip(event) {
-                const tooltip = document.getElementById('tooltip');
-                let x = event.clientX + 15;
-                let y = event.clientY + 15;
-                
-                // Keep tooltip in viewport
-                const rect = tooltip.getBoundingClientRect();
-                if (x + rect.width > window.innerWidth - 400) {
-                    x = event.clientX - rect.width - 15;
-                }
-                if (y + rect.height > window.innerHeight) {
-                    y = event.clientY - rect.height - 15;
-                }
-                
-                tooltip.style.left = x + 'px';
-                tooltip.style.top = y + 'px';
-            }
-            
-            function hideTooltip() {
-                document.getElementById('tooltip').style.display = 'none';
-            }
-            
-            // Highlight specific file from sidebar
-            window.highlightFile = function(filepath) {
-                const targetNode = root.descendants().find(d => d.data.fullPath === filepath);
-                if (targetNode) {
-                    // Zoom to the file's location
-                    const parent = targetNode.parent || root;
-                    focus = parent;
-                    zoomToCircle([parent.x, parent.y, parent.r * 2]);
-                    updateBreadcrumb(parent);
-                    
-                    // Adjust D3 zoom transform to center on the file
-                    const scale = Math.min(width, height) / (parent.r * 4);
-                    const x = -parent.x * scale + width / 2;
-                    const y = -parent.y * scale + height / 2;
-                    
-                    svg.transition()
-                        .duration(750)
-                        .call(zoomBehavior.transform, 
-                              d3.zoomIdentity.translate(x - width/2, y - height/2).scale(scale));
-                    
-                    // Flash the circle
-                    node.filter(d => d.data.fullPath === filepath)
-                        .transition()
-                        .duration(200)
-                        .attr('stroke', '#fff')
-                        .attr('stroke-width', 3)
-                        .transition()
-                        .duration(1000)
-                        .attr('stroke', 'none')
-                        .attr('stroke-width', 0);
-                    
-                    // Show file detail view
-                    showFileDetail(targetNode);
-                }
-            };
-            
-            // Show file detail view with commit history
-            function showFileDetail(d) {
-                const mainView = document.getElementById('main-view');
-                const detailView = document.getElementById('file-detail-view');
-                const fileName = document.getElementById('detail-file-name');
-                const fileStats = document.getElementById('detail-file-stats');
-                const commitList = document.getElementById('commit-list');
-                
-                // Update file name
-                fileName.textContent = d.data.fullPath || d.data.name;
-                
-                // Update file stats
-                fileStats.innerHTML = `
-                    <span>📝 ${d.data.revisions || 0} revisions</span>
-                    <span>📄 ${(d.data.size || 0).toLocaleString()} lines</span>
-                    ${d.data.authors ? `<span>👥 ${d.data.authors} authors</span>` : ''}
-                    ${d.data.churn ? `<span>📊 ${d.data.churn.toLocaleString()} churn</span>` : ''}
-                `;
-                
-                // Update commit list
-                const commits = d.data.commits || [];
-                if (commits.length > 0) {
-                    commitList.innerHTML = commits.map(c => `
-                        <div class="commit-item">
-                            <div class="commit-hash">${c.hash}</div>
-                            <div class="commit-message">${escapeHtml(c.message)}</div>
-                            <div class="commit-meta">
-                                <span>👤 ${escapeHtml(c.author)}</span>
-                                <span>📅 ${c.date}</span>
-                            </div>
-                        </div>
-                    `).join('');
-                } else {
-                    commitList.innerHTML = '<div class="no-commits">No commit history available</div>';
-                }
-                
-                // Switch views
-                mainView.classList.add('hidden');
-                detailView.classList.add('active');
-                
-                // Highlight the selected circle
-                node.attr('stroke', n => n === d ? '#f72585' : (n.children ? 'rgba(255,255,255,0.1)' : 'none'))
-                    .attr('stroke-width', n => n === d ? 3 : 1);
-            }
-            
-            // Show main view
-            function showMainView() {
-                const mainView = document.getElementById('main-view');
-                const detailView = document.getElementById('file-detail-view');
-                
-                mainView.classList.remove('hidden');
-                detailView.classList.remove('active');
-                
-                // Remove highlighting
-                node.attr('stroke', d => d.children ? 'rgba(255,255,255,0.1)' : 'none')
-                    .attr('stroke-width', 1);
-            }
-            
-            // Escape HTML for safe display
-            function escapeHtml(text) {
-                const div = document.createElement('div');
-                div.textContent = text;
-                return div.innerHTML;
-            }
-            
-            // Make showMainView globally available
-            window.showMainView = showMainView;
-            
-            // Back button handler
-            document.getElementById('back-to-main').addEventListener('click', showMainView);
-            
-            // Sidebar resizer
-            const sidebar = document.getElementById('sidebar');
-            const resizer = document.getElementById('sidebar-resizer');
-            let isResizing = false;
-            
-            resizer.addEventListener('mousedown', (e) => {
-                isResizing = true;
-                resizer.classList.add('active');
-                document.body.style.cursor = 'ew-resize';
-                document.body.style.userSelect = 'none';
-            });
-            
-            document.addEventListener('mousemove', (e) => {
-                if (!isResizing) return;
-                
-                const newWidth = window.innerWidth - e.clientX;
-                if (newWidth >= 280 && newWidth <= 800) {
-                    sidebar.style.width = newWidth + 'px';
-                }
-            });
-            
-            document.addEventListener('mouseup', () => {
-                if (isResizing) {
-                    isResizing = false;
-                    resizer.classList.remove('active');
-                    document.body.style.cursor = '';
-                    document.body.style.userSelect = '';
-                }
-            });
-            
-            // ===== DATE RANGE FILTERING =====
-            
-            // Collect all commit dates from the data
-            const allDates = [];
-            hotspots.forEach(h => {
-                if (h.commits) {
-                    h.commits.forEach(c => {
-                        if (c.date) {
-                            allDates.push(new Date(c.date));
-                        }
-                    });
-                }
-            });
-            
-            if (allDates.length === 0) {
-                // No commit dates available, hide the filter
-                document.getElementById('date-filter').style.display = 'none';
-            } else {
-                // Find min and max dates
-                const minDate = new Date(Math.min(...allDates));
-                const maxDate = new Date(Math.max(...allDates));
-                const dateRange = maxDate - minDate;
-                
-                // Store original data for each node
-                root.descendants().forEach(d => {
-                    if (d.data.commits) {
-                        d.data.originalCommits = [...d.data.commits];
-                        d.data.originalRevisions = d.data.revisions;
-                        d.data.originalNormRevisions = d.data.norm_revisions;
-                    }
-                });
-                
-                // Initialize filter state
-                let currentStartDate = minDate;
-                let currentEndDate = maxDate;
-                
-                // DOM elements
-                const startSlider = document.getElementById('start-slider');
-                const endSlider = document.getElementById('end-slider');
-                const startDateInput = document.getElementById('start-date-input');
-                const endDateInput = document.getElementById('end-date-input');
-                const sliderRange = document.getElementById('slider-range');
-                const dateRangeDisplay = document.getElementById('date-range-display');
-                const resetBtn = document.getElementById('reset-filter-btn');
-                const filteredFilesEl = document.getElementById('filtered-files');
-                const filteredCommitsEl = document.getElementById('filtered-commits');
-                const filteredAuthorsEl = document.getElementById('filtered-authors');
-                const dateFilterContainer = document.getElementById('date-filter');
-                
-                // Update sidebar width when filter is present
-                dateFilterContainer.style.right = sidebar.style.width || '380px';
-                
-                // Format date for display
-                function formatDate(date) {
-                    return date.toLocaleDateString('en-US', { year: 'numeric', month: 'short', day: 'numeric' });
-                }
-                
-                // Format date for input
-                function formatDateForInput(date) {
-                    return date.toISOString().split('T')[0];
-                }
-                
-                // Convert slider value (0-100) to date
-                function sliderToDate(value) {
-                    const ms = minDate.getTime() + (value / 100) * dateRange;
-                    return new Date(ms);
-                }
-                
-                // Convert date to slider value (0-100)
-                function dateToSlider(date) {
-                    return ((date.getTime() - minDate.getTime()) / dateRange) * 100;
-                }
-                
-                // Update the visual slider range
-                function updateSliderRange() {
-                    const startPercent = parseFloat(startSlider.value);
-                    const endPercent = parseFloat(endSlider.value);
-                    sliderRange.style.left = startPercent + '%';
-                    sliderRange.style.width = (endPercent - startPercent) + '%';
-                }
-                
-                // Initialize inputs
-                startDateInput.min = formatDateForInput(minDate);
-                startDateInput.max = formatDateForInput(maxDate);
-                startDateInput.value = formatDateForInput(minDate);
-                endDateInput.min = formatDateForInput(minDate);
-                endDateInput.max = formatDateForInput(maxDate);
-                endDateInput.value = formatDateForInput(maxDate);
-                
-                // Update display
-                function updateDateDisplay() {
-                    dateRangeDisplay.textContent = `${formatDate(currentStartDate)} → ${formatDate(currentEndDate)}`;
-                }
-                updateDateDisplay();
-                updateSliderRange();
-                
-                // Filter and recalculate hotspots
-                function applyDateFilter() {
-                    let totalFilteredCommits = 0;
-                    let allAuthors = new Set();
-                    let filesWithCommits = 0;
-                    
-                    // Find new max revisions for normalization
-                    let maxFilteredRevisions = 0;
-                    
-                    // First pass: count filtered commits per file
-                    root.descendants().forEach(d => {
-                        if (d.data.originalCommits) {
-                            const filteredCommits = d.data.originalCommits.filter(c => {
-                                const commitDate = new Date(c.date);
-                                return commitDate >= currentStartDate && commitDate <= currentEndDate;
-                            });
-                            d.data.filteredRevisions = filteredCommits.length;
-                            maxFilteredRevisions = Math.max(maxFilteredRevisions, filteredCommits.length);
-                        }
-                    });
-                    
-                    if (maxFilteredRevisions === 0) maxFilteredRevisions = 1;
-                    
-                    // Second pass: update node data
-                    root.descendants().forEach(d => {
-                        if (d.data.originalCommits) {
-                            const filteredCommits = d.data.originalCommits.filter(c => {
-                                const commitDate = new Date(c.date);
-                                return commitDate >= currentStartDate && commitDate <= currentEndDate;
-                            });
-                            
-                            d.data.commits = filteredCommits;
-                            d.data.revisions = filteredCommits.length;
-                            d.data.norm_revisions = filteredCommits.length / maxFilteredRevisions;
-                            
-                            totalFilteredCommits += filteredCommits.length;
-                            filteredCommits.forEach(c => allAuthors.add(c.author));
-                            if (filteredCommits.length > 0) filesWithCommits++;
-                        }
-                    });
-                    
-                    // Update stats
-                    filteredFilesEl.textContent = filesWithCommits.toLocaleString();
-                    filteredCommitsEl.textContent = totalFilteredCommits.toLocaleString();
-                    filteredAuthorsEl.textContent = allAuthors.size.toLocaleString();
-                    
-                    // Update sidebar stats
-                    document.getElementById('total-revisions').textContent = totalFilteredCommits.toLocaleString();
-                    
-                    // Update circle colors
-                    node.transition()
-                        .duration(300)
-                        .attr('fill', d => {
-                            if (d.children) {
-                                return 'rgba(30, 30, 50, 0.8)';
-                            }
-                            const intensity = d.data.norm_revisions || 0;
-                            return colorScale(intensity);
-                        });
-                    
-                    // Update top hotspots list
-                    updateTopHotspotsList();
-                }
-                
-                // Update top hotspots list in sidebar
-                function updateTopHotspotsList() {
-                    const fileNodes = root.descendants()
-                        .filter(d => !d.children && d.data.originalCommits)
-                        .map(d => ({
-                            file: d.data.fullPath || d.data.name,
-                            revisions: d.data.revisions,
-                            lines: d.data.size,
-                            node: d
-                        }))
-                        .sort((a, b) => b.revisions - a.revisions)
-                        .slice(0, 10);
-                    
-                    const hotspotList = document.getElementById('hotspot-list');
-                    hotspotList.innerHTML = '';
-                    
-                    fileNodes.forEach(h => {
-                        const item = document.createElement('div');
-                        item.className = 'hotspot-item';
-                        item.innerHTML = `
-                            <div class="hotspot-name">${h.file}</div>
-                            <div class="hotspot-meta">
-                                <span>📝 ${h.revisions} revisions</span>
-                                <span>📄 ${h.lines} lines</span>
-                            </div>
-                        `;
-                        item.onclick = () => {
-                            highlightFile(h.file);
-                        };
-                        hotspotList.appendChild(item);
-                    });
-                }
-                
-                // Slider event handlers
-                let sliderTimeout;
-                
-                startSlider.addEventListener('input', () => {
-                    let startVal = parseFloat(startSlider.value);
-                    let endVal = parseFloat(endSlider.value);
-                    
-                    // Prevent crossing
-                    if (startVal > endVal - 1) {
-                        startVal = endVal - 1;
-                        startSlider.value = startVal;
-                    }
-                    
-                    currentStartDate = sliderToDate(startVal);
-                    startDateInput.value = formatDateForInput(currentStartDate);
-                    updateSliderRange();
-                    updateDateDisplay();
-                    
-                    // Debounce the filter update
-                    clearTimeout(sliderTimeout);
-                    sliderTimeout = setTimeout(applyDateFilter, 150);
-                });
-                
-                endSlider.addEventListener('input', () => {
-                    let startVal = parseFloat(startSlider.value);
-                    let endVal = parseFloat(endSlider.value);
-                    
-                    // Prevent crossing
-                    if (endVal < startVal + 1) {
-                        endVal = startVal + 1;
-                        endSlider.value = endVal;
-                    }
-                    
-                    currentEndDate = sliderToDate(endVal);
-                    endDateInput.value = formatDateForInput(currentEndDate);
-                    updateSliderRange();
-                    updateDateDisplay();
-                    
-                    // Debounce the filter update
-                    clearTimeout(sliderTimeout);
-                    sliderTimeout = setTimeout(applyDateFilter, 150);
-                });
-                
-                // Date input handlers
-                startDateInput.addEventListener('change', () => {
-                    const newDate = new Date(startDateInput.value);
-                    if (newDate >= minDate && newDate <= currentEndDate) {
-                        currentStartDate = newDate;
-                        startSlider.value = dateToSlider(newDate);
-                        updateSliderRange();
-                        updateDateDisplay();
-                        applyDateFilter();
-                    }
-                });
-                
-                endDateInput.addEventListener('change', () => {
-                    const newDate = new Date(endDateInput.value);
-                    if (newDate <= maxDate && newDate >= currentStartDate) {
-                        currentEndDate = newDate;
-                        endSlider.value = dateToSlider(newDate);
-                        updateSliderRange();
-                        updateDateDisplay();
-                        applyDateFilter();
-                    }
-                });
-                
-                // Reset button
-                resetBtn.addEventListener('click', () => {
-                    currentStartDate = minDate;
-                    currentEndDate = maxDate;
-                    startSlider.value = 0;
-                    endSlider.value = 100;
-                    startDateInput.value = formatDateForInput(minDate);
-                    endDateInput.value = formatDateForInput(maxDate);
-                    updateSliderRange();
-                    updateDateDisplay();
-                    applyDateFilter();
-                });
-                
-                // Initial filter stats
-                applyDateFilter();
-                
-                // Update filter container width when sidebar resizes
-                const originalResizeHandler = document.onmousemove;
-                document.addEventListener('mousemove', (e) => {
-                    if (isResizing) {
-                        const newWidth = window.innerWidth - e.clientX;
-                        if (newWidth >= 280 && newWidth <= 800) {
-                            dateFilterContainer.style.right = newWidth + 'px';
-                        }
-                    }
-                });
-            }
-            
-        }).catch(function(error) {
-            console.error('Error loading data:', error);
-            document.getElementById('chart').innerHTML = 
-                '<p style="color: #f72585; padding: 2rem;">Error loading data. Make sure hotspot_data.json exists.</p>';
-        });
-    </script>
-</body>
-</html>'''
-    
+    """Copy the D3.js visualization page (templates/index.html) into the output directory."""
     html_path = os.path.join(output_dir, 'index.html')
-    with open(html_path, 'w') as f:
-        f.write(html_content)
-    
+    shutil.copyfile(os.path.join(TEMPLATE_DIR, 'index.html'), html_path)
     return html_path
 
 
+def write_json(path, data):
+    """
+    Write data as compact JSON (the file is only read by the visualization),
+    plus a gzipped copy at path + '.gz' for the server to send compressed.
+    Uses orjson when installed and falls back to the standard json module,
+    encoding in one json.dumps call: json.dump streams through the pure-Python
+    encoder, which is several times slower.
+    """
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. undecodable paths, which orjson rejects
+    if payload is None:
+        # ASCII-only, since json.dumps escapes everything else
+        payload = json.dumps(data, separators=(',', ':')).encode('ascii')
+    
+    with open(path, 'wb') as f:
+        f.write(payload)
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(payload, compresslevel=6))
+
+
+@functools.lru_cache(maxsize=None)
+def day_epoch_ms(date):
+    """
+    Epoch milliseconds of UTC midnight on a YYYY-MM-DD date - the value the
+    browser's Date.parse gives for it - or None if it isn't such a date.
+    Cached, since every commit on the same day shares the result.
+    """
+    try:
+        day = datetime.strptime(date, '%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+    return int(day.replace(tzinfo=timezone.utc).timestamp()) * 1000
+
+
+def write_visualization_data(output_dir, data):
+    """
+    Write the data the visualization loads.
+    hotspot_data.json keeps the hierarchy and per-file stats, but only the
+    time (epoch ms, as 't') and author of each commit - all the date filter
+    needs to render. Hashes, messages and dates go to hotspot_commits/<n>.json,
+    one list per file for COMMIT_SHARD_SIZE files at a time, fetched when a
+    file's history is opened.
+    Returns the path of hotspot_data.json.
+    """
+    manifest = {k: v for k, v in data.items()
+                if k not in ('hotspots', 'hierarchy', 'commit_messages')}
+    manifest['hotspots'] = [{k: v for k, v in h.items() if k != 'commits'}
+                            for h in data['hotspots']]
+    manifest['commit_shard_size'] = COMMIT_SHARD_SIZE
+    
+    file_ids = {h['file']: i for i, h in enumerate(data['hotspots'])}
+    details = [[] for _ in data['hotspots']]
+    
+    # Copy the hierarchy with an explicit stack, as build_hierarchy does
+    manifest['hierarchy'] = dict(data['hierarchy'])
+    stack = [manifest['hierarchy']]
+    while stack:
+        node = stack.pop()
+        if 'children' in node:
+            node['children'] = [dict(child) for child in node['children']]
+            stack.extend(node['children'])
+            continue
+        commits = node.pop('commits', None)
+        file_id = file_ids.get(node.get('fullPath'))
+        if file_id is None:
+            continue
+        node['id'] = file_id
+        if commits:
+            node['commits'] = [{'t': day_epoch_ms(c['date']), 'author': c['author']} for c in commits]
+            details[file_id] = [{'hash': c['hash'], 'message': c['message'], 'date': c['date']}
+                                for c in commits]
+    
+    json_path = os.path.join(output_dir, 'hotspot_data.json')
+    write_json(json_path, manifest)
+    
+    # Remove shards left over from a previous, larger analysis - only files
+    # named like shards, since --output may point at a directory with other files
+    commits_dir = os.path.join(output_dir, COMMIT_SHARD_DIR)
+    os.makedirs(commits_dir, exist_ok=True)
+    shard_count = -(-len(details) // COMMIT_SHARD_SIZE)
+    with os.scandir(commits_dir) as entries:
+        for entry in entries:
+            match = SHARD_FILE_RE.match(entry.name)
+            if match and int(match.group(1)) >= shard_count and entry.is_file():
+                os.remove(entry.path)
+    for shard, start in enumerate(range(0, len(details), COMMIT_SHARD_SIZE)):
+        write_json(os.path.join(commits_dir, f'{shard}.json'),
+                   details[start:start + COMMIT_SHARD_SIZE])
+    
+    return json_path
+
+
 def start_server(directory, port=8080):
     """Start a simple HTTP server to serve the visualization."""
     os.chdir(directory)
     
     handler = http.server.SimpleHTTPRequestHandler
     
-    # Suppress server logs
+    # Suppress server logs. HTTP/1.1 keeps connections alive between the
+    # page's requests (files are sent with a Content-Length); reloads get 304s
+    # from the handler's If-Modified-Since support.
     class QuietHandler(handler):
+        protocol_version = 'HTTP/1.1'
+        
+        def send_head(self):
+            # Send the gzipped copy write_json leaves next to each data file
+            # when the browser accepts it. Its Last-Modified comes from the .gz
+            # file, so revalidations are checked against that file too.
+            path = self.translate_path(self.path)
+            gz_path = path + '.gz'
+            if ('gzip' not in self.headers.get('Accept-Encoding', '')
+                    or not os.path.isfile(gz_path)):
+                return super().send_head()
+            try:
+                f = open(gz_path, 'rb')
+            except OSError:
+                return super().send_head()
+            fs = os.fstat(f.fileno())
+            if self.not_modified_since(fs.st_mtime):
+                f.close()
+                self.send_response(304)
+                self.send_header('Vary', 'Accept-Encoding')
+                self.end_headers()
+                return None
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(fs.st_size))
+            self.send_header('Last-Modified', self.date_time_string(fs.st_mtime))
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return f
+        
+        def not_modified_since(self, mtime):
+            """Whether the request's If-Modified-Since covers mtime (as the base handler checks)."""
+            ims = self.headers.get('If-Modified-Since')
+            if ims is None or 'If-None-Match' in self.headers:
+                return False
+            try:
+                ims_time = email.utils.parsedate_to_datetime(ims)
+            except (TypeError, IndexError, OverflowError, ValueError):
+                return False
+            if ims_time.tzinfo is None:
+                ims_time = ims_time.replace(tzinfo=timezone.utc)
+            last_modified = datetime.fromtimestamp(mtime, timezone.utc).replace(microsecond=0)
+            return last_modified <= ims_time
+        
         def log_message(self, format, *args):
             pass
     
     # Try ports until we find an available one
     for p in range(port, port + 100):
         try:
-            with socketserver.TCPServer(("", p), QuietHandler) as httpd:
+            # One thread per connection, so the browser's parallel requests
+            # for the page, data and commit shards don't queue behind each other
+            with http.server.ThreadingHTTPServer(("", p), QuietHandler) as httpd:
                 print(f"\n🌐 Visualization server running at: http://localhost:{p}")
                 print("   Press Ctrl+C to stop the server\n")
                 httpd.serve_forever()
@@ -2248,28 +1289,27 @@ Cache options:
     
     # Run analysis if cache not valid
     if not cache_valid:
-        # Step 1: Get revision frequency
-        print("📊 Analyzing revision frequency...")
-        revisions = get_revision_frequency(repo_path, args.since, exclusions)
+        # Tracked files are listed once and shared: the history scan uses
+        # them to skip exclusion checks for paths still in the tree
+        tracked_files = list_tracked_files(repo_path, exclusions)
+        
+        # Step 1: Walk the git history once for all history-based metrics
+        print("📊 Analyzing git history (revisions, authors, churn, commits)...")
+        if use_cache:
+            revisions, churn, authors, commit_messages = collect_all_metrics_incremental(
+                repo_path, args.since, exclusions, tracked_files)
+        else:
+            revisions, churn, authors, commit_messages = collect_all_metrics(
+                repo_path, args.since, exclusions, tracked_files)
         print(f"   Found {len(revisions)} files with revision history")
+        print(f"   Found commits for {len(commit_messages)} files")
         
         # Step 2: Count lines of code
         print("📏 Counting lines of code...")
-        loc = count_lines_of_code(repo_path, exclusions)
+        loc = count_lines_of_code(repo_path, exclusions, tracked_files)
         print(f"   Analyzed {len(loc)} files")
         
-        # Step 3: Get additional metrics
-        print("👥 Analyzing author distribution...")
-        authors = get_author_count(repo_path, args.since, exclusions)
-        
-        print("📈 Calculating code churn...")
-        churn = get_churn_data(repo_path, args.since, exclusions)
-        
-        print("💬 Collecting commit messages...")
-        commit_messages = get_commit_messages(repo_path, args.since, exclusions)
-        print(f"   Found commits for {len(commit_messages)} files")
-        
-        # Step 4: Calculate hotspots
+        # Step 3: Calculate hotspots
         print("🔥 Calculating hotspots...")
         hotspots = calculate_hotspots(revisions, loc, churn, authors)
         print(f"   Identified {len(hotspots)} files for analysis")
@@ -2285,11 +1325,11 @@ Cache options:
             print("   - The --since date is too recent")
             sys.exit(1)
         
-        # Step 5: Build hierarchy for visualization
+        # Step 4: Build hierarchy for visualization
         print("🌳 Building visualization hierarchy...")
         hierarchy = build_hierarchy(hotspots)
         
-        # Step 6: Save data
+        # Step 5: Save data
         data = {
             'repository': repo_path,
             'analyzed_at': datetime.now().isoformat(),
@@ -2306,12 +1346,10 @@ Cache options:
                 print(f"📦 Results cached to: {cache_path}")
     
     # Save to output directory
-    json_path = os.path.join(output_dir, 'hotspot_data.json')
-    with open(json_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    json_path = write_visualization_data(output_dir, data)
     print(f"💾 Data saved to: {json_path}")
     
-    # Step 7: Generate HTML
+    # Step 6: Generate HTML
     html_path = generate_html(output_dir)
     print(f"📄 Visualization created: {html_path}")
     
@@ -2324,7 +1362,7 @@ Cache options:
         print(f"    Revisions: {h['revisions']:>4} | Lines: {h['lines']:>5} | Score: {score_bar}")
     print()
     
-    # Step 8: Start server and open browser (unless --no-serve)
+    # Step 7: Start server and open browser (unless --no-serve)
     if args.no_serve:
         print(f"\n✅ Analysis complete! Open {html_path} in a browser to view.")
         print("   (Tip: You may need to serve the files via HTTP for the visualization to work)")
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_hotspots  # noqa: E402
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-C', repo, *args], check=True, capture_output=True)
+
+
+def write(repo, path, lines):
+    full_path = os.path.join(repo, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, 'w') as f:
+        f.write(''.join(f'line {i}\n' for i in range(lines)))
+
+
+class ExclusionPatternTest(unittest.TestCase):
+    
+    def test_component_wildcards_stay_within_one_component(self):
+        is_excluded = analyze_hotspots.compile_exclusions(('a*b',))
+        self.assertTrue(is_excluded('src/a.b/x.py'))
+        self.assertTrue(is_excluded('src/a.png/b'))  # trailing part of the path
+        self.assertFalse(is_excluded('a.png/b/.coverage'))
+    
+    def test_glob_directory_matches_any_component(self):
+        is_excluded = analyze_hotspots.compile_exclusions(('*.egg-info/*',))
+        self.assertTrue(is_excluded('pkg.egg-info/PKG-INFO'))
+        self.assertTrue(is_excluded('src/pkg.egg-info/top_level.txt'))
+        self.assertFalse(is_excluded('src/pkg.egg/info.txt'))
+
+
+class RenameAcrossExcludedDirTest(unittest.TestCase):
+    """The plain and --cache scans must agree when a rename crosses an excluded directory."""
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = os.path.join(tmp.name, 'repo')
+        os.makedirs(self.repo)
+        git(self.repo, 'init', '-q')
+        git(self.repo, 'config', 'user.name', 'Tester')
+        git(self.repo, 'config', 'user.email', 'tester@example.com')
+        
+        write(self.repo, 'lib/bar.js', 120)
+        write(self.repo, 'lib2/baz.js', 80)
+        self.commit('add files')
+        # Out of and back into the excluded directory, content mostly unchanged
+        git(self.repo, 'mv', 'lib/bar.js', 'lib2/bar.js')
+        git(self.repo, 'mv', 'lib2/baz.js', 'lib/baz.js')
+        self.commit('move files')
+        write(self.repo, 'lib2/bar.js', 125)
+        self.commit('edit bar')
+        git(self.repo, 'mv', 'lib2/bar.js', 'lib/bar.js')
+        self.commit('move bar back')
+        
+        cache_dir = os.path.join(tmp.name, 'commits')
+        patcher = mock.patch.object(analyze_hotspots, 'COMMIT_CACHE_DIR', cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def commit(self, message):
+        git(self.repo, 'add', '-A')
+        git(self.repo, 'commit', '-q', '-m', message)
+    
+    def test_cached_scan_matches_plain_scan(self):
+        exclusions = ['lib2/*']
+        plain = analyze_hotspots.collect_all_metrics(self.repo, exclusions=exclusions)
+        cold = analyze_hotspots.collect_all_metrics_incremental(self.repo, exclusions=exclusions)
+        warm = analyze_hotspots.collect_all_metrics_incremental(self.repo, exclusions=exclusions)
+        
+        self.assertEqual(plain, cold)
+        self.assertEqual(plain, warm)
+        self.assertNotIn('lib2/bar.js', plain[0])
+        self.assertEqual(plain[0]['lib/bar.js'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()